@@ -1,6 +1,15 @@
+import io
+import json
+import socket
+import urllib.error
+import urllib.request
+from pathlib import Path
+
 import pytest
+from filelock import FileLock
 from flaky import flaky
 
+from modflow_devtools import download
 from modflow_devtools.download import (
     download_and_unzip,
     download_artifact,
@@ -24,7 +33,6 @@ def test_get_releases_bad_params(per_page, retries):
         get_releases("executables", per_page=per_page, retries=retries, verbose=True)
 
 
-@flaky
 @requires_github
 @pytest.mark.parametrize("repo", _repos)
 def test_get_releases(repo):
@@ -32,15 +40,105 @@ def test_get_releases(repo):
     assert any(releases)
     assert all("created_at" in r for r in releases)
 
-    assets = [a for aa in [r["assets"] for r in releases] for a in aa]
-    assert all(repo in a["browser_download_url"] for a in assets)
+    assert all(repo in a["browser_download_url"] for r in releases for a in r["assets"])
 
     # test page size option
     if repo == "MODFLOW-USGS/modflow6-nightly-build":
         assert len(releases) <= 31  # 30-day retention period
 
 
-@flaky
+_release = {"tag_name": "6.4.0", "assets": []}
+_artifact = {"id": 1, "name": "artifact"}
+_transient_errors = {
+    "502": urllib.error.HTTPError("url", 502, "Bad Gateway", {}, None),
+    "503": urllib.error.HTTPError("url", 503, "Service Unavailable", {}, None),
+    "504": urllib.error.HTTPError("url", 504, "Gateway Timeout", {}, None),
+    "urlerror": urllib.error.URLError("connection reset"),
+    "timeout": socket.timeout("timed out"),
+}
+_not_found = urllib.error.HTTPError("url", 404, "Not Found", {}, None)
+
+
+class _Response(io.BytesIO):
+    headers = {"x-ratelimit-remaining": "100"}
+
+
+@pytest.fixture
+def stub_urlopen(monkeypatch):
+    """Serve the queued responses (or raise the queued errors) in
+    order instead of making requests, and record backoff delays."""
+    responses = []
+    delays = []
+
+    def urlopen(request, timeout=None):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return _Response(json.dumps(response).encode())
+
+    monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+    monkeypatch.setattr(download, "sleep", delays.append)
+    return responses, delays
+
+
+_retried = [
+    ("get_release", get_release, _release, _release),
+    ("get_releases", get_releases, [_release], [_release]),
+    (
+        "list_artifacts",
+        list_artifacts,
+        {"total_count": 1, "artifacts": [_artifact]},
+        [_artifact],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "fetch, body, expected, error",
+    [
+        pytest.param(fetch, body, expected, error, id=f"{name}-{error_name}")
+        for name, fetch, body, expected in _retried
+        for error_name, error in _transient_errors.items()
+    ]
+    + [
+        # GitHub sometimes returns 404 for valid URLs. get_release
+        # only retries these for listed tags, tested separately
+        pytest.param(fetch, body, expected, _not_found, id=f"{name}-404")
+        for name, fetch, body, expected in _retried
+        if fetch is not get_release
+    ],
+)
+def test_retries(stub_urlopen, fetch, body, expected, error):
+    responses, delays = stub_urlopen
+    responses[:] = [error, error, body]
+    with pytest.warns(UserWarning, match="URL request"):
+        assert fetch("owner/repo", retries=3) == expected
+    assert delays == [1, 2]
+
+    # give up once out of retries
+    responses[:] = [error, error]
+    with pytest.warns(UserWarning), pytest.raises(RuntimeError):
+        fetch("owner/repo", retries=2)
+
+
+def test_get_release_retries_listed_tag(stub_urlopen, monkeypatch):
+    responses, delays = stub_urlopen
+    monkeypatch.setattr(
+        download, "get_releases", lambda repo, verbose=False: [_release]
+    )
+
+    # a 404 for a listed tag is retried
+    responses[:] = [_not_found, _release]
+    with pytest.warns(UserWarning, match="URL request"):
+        assert get_release("owner/repo", "6.4.0", retries=3) == _release
+    assert delays == [1]
+
+    # a 404 for an unlisted tag is not
+    responses[:] = [_not_found]
+    with pytest.raises(ValueError, match="Release 6.3.0 not found"):
+        get_release("owner/repo", "6.3.0", retries=3)
+
+
 @requires_github
 @pytest.mark.parametrize("repo", _repos)
 def test_get_release(repo):
@@ -97,22 +195,49 @@ def test_download_artifact(function_tmpdir, delete_zip):
         verbose=False,
     )
 
-    assert len(list(function_tmpdir.rglob("*"))) >= (0 if delete_zip else 1)
-    assert any(list(function_tmpdir.rglob("*.zip"))) != delete_zip
+    paths = list(function_tmpdir.rglob("*"))
+    assert len(paths) >= (0 if delete_zip else 1)
+    assert any(p.suffix == ".zip" for p in paths) != delete_zip
+
+
+_mf6_zip_name = "mf6.3.0_linux.zip"
+_mf6_zip_url = (
+    f"https://github.com/MODFLOW-USGS/modflow6/releases/download/6.3.0/{_mf6_zip_name}"
+)
+
+
+@pytest.fixture(scope="session")
+def mf6_zip(tmp_path_factory, worker_id) -> Path:
+    """Download the release archive once and share it between tests.
+    With xdist, the first worker to get the lock downloads it to the
+    session's base temp dir and the others reuse it."""
+    if worker_id == "master":
+        path = tmp_path_factory.mktemp("mf6_zip")
+        download_and_unzip(_mf6_zip_url, path, delete_zip=False, verbose=True)
+        return path / _mf6_zip_name
+
+    root = tmp_path_factory.getbasetemp().parent
+    path = root / "mf6_zip"
+    with FileLock(str(root / "mf6_zip.lock")):
+        # the archive is unzipped after it's fully written
+        if not (path / _mf6_zip_name.replace(".zip", "")).is_dir():
+            download_and_unzip(_mf6_zip_url, path, delete_zip=False, verbose=True)
+    return path / _mf6_zip_name
 
 
 @flaky
 @requires_github
 @pytest.mark.parametrize("delete_zip", [True, False])
-def test_download_and_unzip(function_tmpdir, delete_zip):
-    zip_name = "mf6.3.0_linux.zip"
-    dir_name = zip_name.replace(".zip", "")
-    url = f"https://github.com/MODFLOW-USGS/modflow6/releases/download/6.3.0/{zip_name}"
-    download_and_unzip(url, function_tmpdir, delete_zip=delete_zip, verbose=True)
+def test_download_and_unzip(function_tmpdir, mf6_zip, delete_zip):
+    # unzip a local copy rather than downloading the archive again
+    download_and_unzip(
+        mf6_zip.as_uri(), function_tmpdir, delete_zip=delete_zip, verbose=True
+    )
 
-    assert (function_tmpdir / zip_name).is_file() != delete_zip
+    assert (function_tmpdir / _mf6_zip_name).is_file() != delete_zip
+    assert mf6_zip.is_file()
 
-    dir_path = function_tmpdir / dir_name
+    dir_path = function_tmpdir / _mf6_zip_name.replace(".zip", "")
     assert dir_path.is_dir()
 
     contents = list(dir_path.rglob("*"))
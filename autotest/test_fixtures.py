@@ -6,7 +6,6 @@ import pytest
 from _pytest.config import ExitCode
 
 system = platform.system()
-proj_root = Path(__file__).parents[1]
 module_path = Path(inspect.getmodulename(__file__))
 
 
@@ -5,6 +5,7 @@ from shutil import which
 import pytest
 from packaging.version import Version
 
+from modflow_devtools import markers
 from modflow_devtools.markers import (
     excludes_platform,
     no_parallel,
@@ -91,3 +92,22 @@ def test_no_parallel(worker_id):
 
     assert environ.get("PYTEST_XDIST_WORKER") is None
     assert worker_id == "master"
+
+
+def test_network_check_deferred_and_cached(monkeypatch):
+    calls = []
+
+    def is_connected(hostname):
+        calls.append(hostname)
+        return False
+
+    monkeypatch.setattr(markers, "is_connected", is_connected)
+
+    # no connection check until the condition is evaluated
+    unreachable = markers._Unreachable("github.com")
+    assert not any(calls)
+
+    # checked once, then cached
+    assert unreachable
+    assert unreachable
+    assert calls == ["github.com"]
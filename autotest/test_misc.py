@@ -1,3 +1,4 @@
+import fnmatch
 import os
 import re
 import shutil
@@ -91,7 +92,11 @@ def test_get_packages_fails_on_invalid_namefile(module_tmpdir):
     model_path = _testmodels_repo_paths_mf6[0]
     new_model_path = module_tmpdir / model_path.name
     namefile_path = new_model_path / "mfsim.nam"
-    shutil.copytree(model_path, new_model_path)
+    new_model_path.mkdir()
+    # copy the model namefiles too, so a wrongly resolved
+    # reference would pull in the model's packages
+    for nfp in model_path.glob("*.nam"):
+        shutil.copy(nfp, new_model_path)
 
     # invalid gwf namefile reference:
     # result should only contain packages from mfsim.nam
@@ -101,7 +106,8 @@ def test_get_packages_fails_on_invalid_namefile(module_tmpdir):
             if "GWF6" in line:
                 line = line.replace("GWF6", "GWF6  garbage")
             f.write(line + os.linesep)
-    assert set(get_packages(namefile_path)) == {"gwf", "tdis", "ims"}
+    with pytest.warns(UserWarning, match="Failed to parse GWF or GWT model namefile"):
+        assert set(get_packages(namefile_path)) == {"gwf", "tdis", "ims"}
 
     # entirely unparseable namefile - result should be empty
     lines = open(namefile_path, "r").read().splitlines()
@@ -128,23 +134,18 @@ def test_has_package():
 
 
 def get_expected_model_dirs(path, pattern="mfsim.nam") -> List[Path]:
-    folders = []
-    for root, dirs, files in os.walk(path):
-        for d in dirs:
-            p = Path(root) / d
-            if any(p.glob(pattern)):
-                folders.append(p)
-    return sorted(list(set(folders)))
+    return sorted(set(p.parent for p in get_expected_namefiles(path, pattern)))
 
 
 def get_expected_namefiles(path, pattern="mfsim.nam") -> List[Path]:
-    folders = []
+    # match against the listings os.walk already made,
+    # rather than globbing each subdirectory again
+    namefiles = []
     for root, dirs, files in os.walk(path):
-        for d in dirs:
-            p = Path(root) / d
-            found = list(p.glob(pattern))
-            folders = folders + found
-    return sorted(list(set(folders)))
+        if Path(root) == Path(path):
+            continue
+        namefiles += [Path(root) / f for f in fnmatch.filter(files + dirs, pattern)]
+    return sorted(set(namefiles))
 
 
 @pytest.mark.skipif(not any(_example_paths), reason="modflow6-examples repo not found")
@@ -164,13 +165,8 @@ def test_get_model_paths_examples():
     not any(_largetestmodel_paths), reason="modflow6-largetestmodels not found"
 )
 def test_get_model_paths_largetestmodels():
-    expected_paths = get_expected_model_dirs(_examples_path)
-    paths = get_model_paths(_examples_path)
-    assert sorted(paths) == sorted(list(set(paths)))
-    assert set(expected_paths) == set(paths)
-
-    expected_paths = get_expected_model_dirs(_examples_path)
-    paths = get_model_paths(_examples_path)
+    expected_paths = get_expected_model_dirs(_largetestmodels_repo_path)
+    paths = get_model_paths(_largetestmodels_repo_path)
     assert sorted(paths) == sorted(list(set(paths)))
     assert set(expected_paths) == set(paths)
 
@@ -210,11 +206,6 @@ def test_get_namefile_paths_largetestmodels():
     assert paths == sorted(list(set(paths)))
     assert set(expected_paths) == set(paths)
 
-    expected_paths = get_expected_namefiles(_largetestmodels_repo_path)
-    paths = get_namefile_paths(_largetestmodels_repo_path)
-    assert paths == sorted(list(set(paths)))
-    assert set(expected_paths) == set(paths)
-
 
 @pytest.mark.skipif(
     not any(_largetestmodel_paths) or not any(_example_paths),
@@ -253,6 +244,9 @@ def test_get_namefile_paths_select_packages():
 def test_has_pkg():
     assert has_pkg("pytest")
     assert not has_pkg("notapkg")
+    assert not has_pkg("notapkg")  # cached result stays negative
+    assert has_pkg("pytest", strict=True)
+    assert not has_pkg("notapkg", strict=True)
 
 
 def test_timed1(capfd):
@@ -5,10 +5,9 @@ import numpy as np
 import pytest
 from _pytest.config import ExitCode
 
-proj_root = Path(__file__).parents[1]
 module_path = Path(inspect.getmodulename(__file__))
 snapshot_array = np.array([1.1, 2.2, 3.3])
-snapshots_path = proj_root / "autotest" / "__snapshots__"
+snapshots_path = Path(__file__).parent / "__snapshots__"
 
 
 def test_binary_array_snapshot(array_snapshot):
@@ -3,7 +3,6 @@ import shutil
 import sys
 import zipfile
 from pathlib import Path
-from pprint import pprint
 from shutil import which
 from zipfile import ZipFile
 
@@ -27,13 +26,11 @@ def test_compressall(function_tmpdir):
         f.write("hello world")
 
     MFZipFile.compressall(str(zip_file), dir_pths=str(input_dir))
-    pprint(list(function_tmpdir.iterdir()))
     assert zip_file.exists()
 
     output_dir = function_tmpdir / "output"
     output_dir.mkdir()
     ZipFile(zip_file).extractall(path=str(output_dir))
-    pprint(list(output_dir.iterdir()))
     assert (output_dir / "data.txt").is_file()
 
 
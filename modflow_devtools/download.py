@@ -1,17 +1,28 @@
 import json
 import os
+import shutil
+import socket
 import sys
 import tarfile
 import timeit
 import urllib.request
 from os import PathLike
 from pathlib import Path
+from time import sleep
 from typing import List, Optional, Union
 from uuid import uuid4
 from warnings import warn
 
 from modflow_devtools.zip import MFZipFile
 
+# transient server errors, worth retrying
+_retry_status_codes = (502, 503, 504)
+
+
+def _backoff(tries):
+    """Wait before retrying a request, doubling the delay each try."""
+    sleep(2 ** (tries - 1))
+
 
 def get_request(url, params={}):
     """
@@ -95,9 +106,18 @@ def get_releases(
                     raise ValueError(
                         f"use GITHUB_TOKEN env to bypass rate limit ({err})"
                     ) from err
-                elif err.code in (404, 503) and tries < retries:
-                    # GitHub sometimes returns this error for valid URLs, so retry
+                elif (
+                    err.code == 404 or err.code in _retry_status_codes
+                ) and tries < retries:
+                    # GitHub sometimes returns 404 for valid URLs, so retry
                     warn(f"URL request try {tries} failed ({err})")
+                    _backoff(tries)
+                    continue
+                raise RuntimeError(f"cannot retrieve data from {req_url}") from err
+            except (urllib.error.URLError, socket.timeout) as err:
+                if tries < retries:
+                    warn(f"URL request try {tries} failed ({err})")
+                    _backoff(tries)
                     continue
                 raise RuntimeError(f"cannot retrieve data from {req_url}") from err
 
@@ -107,7 +127,7 @@ def get_releases(
         rels = get_response_json()
         page += 1
         releases.extend(rels)
-        if not any(rels) or len(rels) < per_page:
+        if not rels or len(rels) < per_page:
             break
 
     if verbose:
@@ -135,7 +155,7 @@ def get_release(repo, tag="latest", retries=3, verbose=False) -> dict:
     if "/" not in repo:
         raise ValueError("repo format must be owner/name")
 
-    if not isinstance(tag, str) or not any(tag):
+    if not isinstance(tag, str) or not tag:
         raise ValueError("tag must be a non-empty string")
 
     if not isinstance(retries, int) or retries < 1:
@@ -148,7 +168,7 @@ def get_release(repo, tag="latest", retries=3, verbose=False) -> dict:
         else f"{req_url}/releases/tags/{tag}"
     )
     request = get_request(req_url)
-    releases = None
+    tags = None
     num_tries = 0
 
     while True:
@@ -171,15 +191,26 @@ def get_release(repo, tag="latest", retries=3, verbose=False) -> dict:
                     f"use GITHUB_TOKEN env to bypass rate limit ({err})"
                 ) from err
             elif err.code == 404:
-                if releases is None:
-                    releases = get_releases(repo, verbose=verbose)
-                if tag not in releases:
+                if tags is None:
+                    tags = [r["tag_name"] for r in get_releases(repo, verbose=verbose)]
+                if tag not in tags:
                     raise ValueError(
-                        f"Release {tag} not found (choose from {', '.join(releases)})"
+                        f"Release {tag} not found (choose from {', '.join(tags)})"
                     )
-            elif err.code == 503 and num_tries < retries:
-                # GitHub sometimes returns this error for valid URLs, so retry
+                if num_tries < retries:
+                    # the tag exists, GitHub sometimes returns 404 for valid URLs
+                    warn(f"URL request {num_tries} failed ({err})")
+                    _backoff(num_tries)
+                    continue
+            elif err.code in _retry_status_codes and num_tries < retries:
                 warn(f"URL request {num_tries} failed ({err})")
+                _backoff(num_tries)
+                continue
+            raise RuntimeError(f"cannot retrieve data from {req_url}") from err
+        except (urllib.error.URLError, socket.timeout) as err:
+            if num_tries < retries:
+                warn(f"URL request {num_tries} failed ({err})")
+                _backoff(num_tries)
                 continue
             raise RuntimeError(f"cannot retrieve data from {req_url}") from err
 
@@ -248,7 +279,7 @@ def get_release_assets(
     if "/" not in repo:
         raise ValueError("repo format must be owner/name")
 
-    if not isinstance(tag, str) or not any(tag):
+    if not isinstance(tag, str) or not tag:
         raise ValueError("tag must be a non-empty string")
 
     if not isinstance(retries, int) or retries < 1:
@@ -331,9 +362,18 @@ def list_artifacts(
                     raise ValueError(
                         f"use GITHUB_TOKEN env to bypass rate limit ({err})"
                     ) from err
-                elif err.code in (404, 503) and tries < retries:
-                    # GitHub sometimes returns this error for valid URLs, so retry
+                elif (
+                    err.code == 404 or err.code in _retry_status_codes
+                ) and tries < retries:
+                    # GitHub sometimes returns 404 for valid URLs, so retry
+                    warn(f"URL request try {tries} failed ({err})")
+                    _backoff(tries)
+                    continue
+                raise RuntimeError(f"cannot retrieve data from {req_url}") from err
+            except (urllib.error.URLError, socket.timeout) as err:
+                if tries < retries:
                     warn(f"URL request try {tries} failed ({err})")
+                    _backoff(tries)
                     continue
                 raise RuntimeError(f"cannot retrieve data from {req_url}") from err
 
@@ -404,8 +444,7 @@ def download_artifact(
             with urllib.request.urlopen(request) as url_file, open(
                 zip_path, "wb"
             ) as out_file:
-                content = url_file.read()
-                out_file.write(content)
+                shutil.copyfileobj(url_file, out_file)
                 break
         except urllib.error.HTTPError as err:
             if tries < retries:
@@ -480,8 +519,7 @@ def download_and_unzip(
             with urllib.request.urlopen(request) as url_file, open(
                 file_path, "wb"
             ) as out_file:
-                content = url_file.read()
-                out_file.write(content)
+                shutil.copyfileobj(url_file, out_file)
 
                 # if verbose, print content length (if available)
                 tag = "Content-length"
@@ -499,6 +537,7 @@ def download_and_unzip(
             if tries < retries:
                 warn(f"URL request try {tries} failed ({err})")
                 continue
+            raise RuntimeError(f"cannot retrieve data from {url}") from err
 
     # write the total download time
     toc = timeit.default_timer()
@@ -1,5 +1,4 @@
 from collections import OrderedDict
-from itertools import groupby
 from os import PathLike, environ
 from pathlib import Path
 from shutil import copytree, rmtree
@@ -14,15 +13,13 @@ pytest = import_optional_dependency("pytest")
 # fixtures
 
 
+# characters in test node names that can't be used in directory names
+_node_name_table = str.maketrans({c: "_" for c in "/\\:[]"})
+
+
 @pytest.fixture(scope="function")
 def function_tmpdir(tmpdir_factory, request) -> Generator[Path, None, None]:
-    node_name = (
-        request.node.name.replace("/", "_")
-        .replace("\\", "_")
-        .replace(":", "_")
-        .replace("[", "_")
-        .replace("]", "_")
-    )
+    node_name = request.node.name.translate(_node_name_table)
     temp = Path(tmpdir_factory.mktemp(node_name))
     yield Path(temp)
 
@@ -92,7 +89,7 @@ def repos_path() -> Optional[Path]:
 @pytest.fixture
 def tabular(request) -> str:
     tab = request.config.option.TABULAR
-    if tab not in ["raw", "recarray", "dataframe"]:
+    if tab not in ("raw", "recarray", "dataframe"):
         raise ValueError(f"Unsupported value for --tabular: {tab}")
     return tab
 
@@ -172,6 +169,10 @@ def pytest_addoption(parser):
 
 
 def pytest_configure(config):
+    # don't reuse parameters found for another
+    # session, e.g. an in-process pytester run
+    _generated_params_cache.clear()
+
     config.addinivalue_line(
         "markers",
         "meta(name): run only by other tests",
@@ -207,6 +208,10 @@ def pytest_runtest_makereport(item, call):
     setattr(item, "rep_" + rep.when, rep)
 
 
+_generated_params_cache = {}
+_excluded_example_names = frozenset(["mf6gwf", "mf6gwt"])
+
+
 def pytest_generate_tests(metafunc):
     # user can filter by model name or packages the model uses
     models_selected = metafunc.config.getoption("--model", None)
@@ -242,55 +247,85 @@ def pytest_generate_tests(metafunc):
             repo_path = None
         return repo_path
 
+    def cached(key: str, find):
+        """Find parameters for the given fixture, reusing results from
+        earlier calls, since this hook runs once per test function.
+        Results must be immutable, since they're shared between
+        test functions."""
+        cache_key = (
+            key,
+            repos_path,
+            tuple(models_selected or []),
+            tuple(packages_selected or []),
+        )
+        if cache_key not in _generated_params_cache:
+            _generated_params_cache[cache_key] = find()
+        return _generated_params_cache[cache_key]
+
     key = "test_model_mf6"
     if key in metafunc.fixturenames:
         repo_path = get_repo_path("modflow6-testmodels")
-        namefile_paths = (
-            get_namefile_paths(
-                repo_path / "mf6",
-                prefix="test",
-                excluded=[],
-                selected=models_selected,
-                packages=packages_selected,
-            )
-            if repo_path
-            else []
+        namefile_paths = cached(
+            key,
+            lambda: tuple(
+                get_namefile_paths(
+                    repo_path / "mf6",
+                    prefix="test",
+                    excluded=[],
+                    selected=models_selected,
+                    packages=packages_selected,
+                )
+                if repo_path
+                else []
+            ),
+        )
+        metafunc.parametrize(
+            key, list(namefile_paths), ids=[str(m) for m in namefile_paths]
         )
-        metafunc.parametrize(key, namefile_paths, ids=[str(m) for m in namefile_paths])
 
     key = "test_model_mf5to6"
     if key in metafunc.fixturenames:
         repo_path = get_repo_path("modflow6-testmodels")
-        namefile_paths = (
-            get_namefile_paths(
-                repo_path / "mf5to6",
-                prefix="test",
-                namefile="*.nam",
-                excluded=[],
-                selected=models_selected,
-                packages=packages_selected,
-            )
-            if repo_path
-            else []
+        namefile_paths = cached(
+            key,
+            lambda: tuple(
+                get_namefile_paths(
+                    repo_path / "mf5to6",
+                    prefix="test",
+                    namefile="*.nam",
+                    excluded=[],
+                    selected=models_selected,
+                    packages=packages_selected,
+                )
+                if repo_path
+                else []
+            ),
+        )
+        metafunc.parametrize(
+            key, list(namefile_paths), ids=[str(m) for m in namefile_paths]
         )
-        metafunc.parametrize(key, namefile_paths, ids=[str(m) for m in namefile_paths])
 
     key = "large_test_model"
     if key in metafunc.fixturenames:
         repo_path = get_repo_path("modflow6-largetestmodels")
-        namefile_paths = (
-            get_namefile_paths(
-                repo_path,
-                prefix="test",
-                namefile="mfsim.nam",
-                excluded=[],
-                selected=models_selected,
-                packages=packages_selected,
-            )
-            if repo_path
-            else []
+        namefile_paths = cached(
+            key,
+            lambda: tuple(
+                get_namefile_paths(
+                    repo_path,
+                    prefix="test",
+                    namefile="mfsim.nam",
+                    excluded=[],
+                    selected=models_selected,
+                    packages=packages_selected,
+                )
+                if repo_path
+                else []
+            ),
+        )
+        metafunc.parametrize(
+            key, list(namefile_paths), ids=[str(m) for m in namefile_paths]
         )
-        metafunc.parametrize(key, namefile_paths, ids=[str(m) for m in namefile_paths])
 
     key = "example_scenario"
     if key in metafunc.fixturenames:
@@ -314,18 +349,16 @@ def pytest_generate_tests(metafunc):
             return example_path_from_namfile_path(path).name
 
         def group_examples(namefile_paths) -> Dict[str, List[Path]]:
+            # group in one pass, since rglob doesn't yield
+            # paths sorted by example, so namefiles for the
+            # same example may not be adjacent
             d = OrderedDict()
-            for name, paths in groupby(
-                namefile_paths, key=example_name_from_namfile_path
-            ):
-                # sort alphabetically (gwf < gwt)
-                nfpaths = sorted(list(paths))
+            for nfp in namefile_paths:
+                d.setdefault(example_name_from_namfile_path(nfp), []).append(nfp)
 
-                # skip if no models found
-                if len(nfpaths) == 0:
-                    continue
-
-                d[name] = nfpaths
+            # sort alphabetically (gwf < gwt)
+            for nfpaths in d.values():
+                nfpaths.sort()
 
             return d
 
@@ -351,35 +384,32 @@ def pytest_generate_tests(metafunc):
 
             # filter by package (optional)
             if packages_selected:
-                filtered = []
-                for name, namefiles in examples.items():
-                    ftypes = []
-                    for namefile in namefiles:
-                        ftype = get_packages(namefile)
-                        if ftype not in ftypes:
-                            ftypes += ftype
-                    if len(ftypes) > 0:
-                        ftypes = [item.upper() for item in ftypes]
-                        for pkg in packages_selected:
-                            if pkg in ftypes:
-                                filtered.append(name)
-                                break
+                pkgs = {p.lower() for p in packages_selected}
                 examples = {
-                    name: nfps for name, nfps in examples.items() if name in filtered
+                    name: nfps
+                    for name, nfps in examples.items()
+                    if any(not pkgs.isdisjoint(get_packages(nfp)) for nfp in nfps)
                 }
 
             # exclude mf6gwf and mf6gwt subdirs
             examples = {
                 name: nfps
                 for name, nfps in examples.items()
-                if name not in ["mf6gwf", "mf6gwt"]
+                if name not in _excluded_example_names
             }
 
             return examples
 
-        example_scenarios = get_examples() if repo_path else dict()
+        example_scenarios = cached(
+            key,
+            lambda: (
+                tuple((name, tuple(nfps)) for name, nfps in get_examples().items())
+                if repo_path
+                else ()
+            ),
+        )
         metafunc.parametrize(
             key,
-            [(name, nfps) for name, nfps in example_scenarios.items()],
-            ids=list(example_scenarios.keys()),
+            [(name, list(nfps)) for name, nfps in example_scenarios],
+            ids=[name for name, _ in example_scenarios],
         )
@@ -31,26 +31,22 @@ def build_table(
 
     if headings is None:
         headings = arr.dtype.names
-    ncols = len(arr.dtype.names)
     label = "tab:{}".format(fpth.stem)
 
-    line = get_header(caption, label, headings, col_widths=col_widths)
+    lines = [get_header(caption, label, headings, col_widths=col_widths)]
 
-    for idx in range(arr.shape[0]):
+    # select each column once, then walk the rows together
+    columns = [arr[name] for name in arr.dtype.names]
+    for idx, row in enumerate(zip(*columns)):
         if idx % 2 != 0:
-            line += "\t\t\\rowcolor{Gray}\n"
-        line += "\t\t"
-        for jdx, name in enumerate(arr.dtype.names):
-            line += f"{arr[name][idx]}"
-            if jdx < ncols - 1:
-                line += " & "
-        line += " \\\\\n"
+            lines.append("\t\t\\rowcolor{Gray}\n")
+        lines.append("\t\t" + " & ".join(f"{v}" for v in row) + " \\\\\n")
 
     # footer
-    line += get_footer()
+    lines.append(get_footer())
 
     with open(fpth, "w") as f:
-        f.write(line)
+        f.write("".join(lines))
 
 
 def get_header(
@@ -79,7 +79,7 @@ def get_suffixes(ostag) -> Tuple[str, str]:
 
     tag = ostag.lower()
 
-    if tag in ["win32", "win64"]:
+    if tag in ("win32", "win64"):
         return ".exe", ".dll"
     elif tag == "linux":
         return "", ".so"
@@ -149,6 +149,10 @@ def get_current_branch() -> str:
     raise ValueError(f"Could not determine current branch: {stderr}")
 
 
+_namefile_skip_prefixes = ("#", "!", "data", "list")
+_namefile_skip_words = frozenset(["begin", "end", "memory_print_option"])
+
+
 def get_packages(namefile_path: PathLike) -> List[str]:
     """
     Return a list of packages used by the simulation
@@ -169,12 +173,19 @@ def get_packages(namefile_path: PathLike) -> List[str]:
 
     packages = []
     path = Path(namefile_path).expanduser().absolute()
-    lines = open(path, "r").readlines()
-    gwf_lines = [ln for ln in lines if ln.strip().lower().startswith("gwf6 ")]
-    gwt_lines = [ln for ln in lines if ln.strip().lower().startswith("gwt6 ")]
+    lines = path.read_text().splitlines()
+    gwf_lines = []
+    gwt_lines = []
+    for ln in lines:
+        model_type = ln.strip().lower()
+        if model_type.startswith("gwf6 "):
+            gwf_lines.append(ln)
+        elif model_type.startswith("gwt6 "):
+            gwt_lines.append(ln)
 
     def parse_model_namefile(line):
-        nf_path = [path.parent / s for s in line.split(" ") if s != ""][1]
+        # the model namefile is the second entry on the line
+        nf_path = path.parent / line.split()[1]
         if nf_path.suffix != ".nam":
             raise ValueError(
                 "Failed to parse GWF or GWT model namefile "
@@ -185,9 +196,9 @@ def get_packages(namefile_path: PathLike) -> List[str]:
     # load model namefiles
     try:
         for line in gwf_lines:
-            packages = packages + get_packages(parse_model_namefile(line)) + ["gwf"]
+            packages.extend(get_packages(parse_model_namefile(line)) + ["gwf"])
         for line in gwt_lines:
-            packages = packages + get_packages(parse_model_namefile(line)) + ["gwt"]
+            packages.extend(get_packages(parse_model_namefile(line)) + ["gwt"])
     except:  # noqa: E722
         warn(f"Invalid namefile format: {traceback.format_exc()}")
 
@@ -198,11 +209,7 @@ def get_packages(namefile_path: PathLike) -> List[str]:
             continue
 
         line = line[0].lower()
-        if any(line.startswith(c) for c in ["#", "!", "data", "list"]) or line in [
-            "begin",
-            "end",
-            "memory_print_option",
-        ]:
+        if line.startswith(_namefile_skip_prefixes) or line in _namefile_skip_words:
             continue
 
         # strip "6" from package name
@@ -252,13 +259,8 @@ def get_namefile_paths(
 
     # filter by package
     if packages:
-        filtered = []
-        for nfp in paths:
-            nf_pkgs = get_packages(nfp)
-            shared = set(nf_pkgs).intersection(set([p.lower() for p in packages]))
-            if any(shared):
-                filtered.append(nfp)
-        paths = filtered
+        pkgs = {p.lower() for p in packages}
+        paths = [nfp for nfp in paths if not pkgs.isdisjoint(get_packages(nfp))]
 
     # filter by model name
     if selected:
@@ -300,23 +302,21 @@ def get_model_paths(
             return 1
 
     model_paths = []
+    seen = set()
     globbed = path.rglob(f"{prefix if prefix else ''}*")
     example_paths = [p for p in globbed if p.is_dir()]
     for p in example_paths:
         for mp in sorted(
-            list(
-                set(
-                    [
-                        p.parent
-                        for p in get_namefile_paths(
-                            p, prefix, namefile, excluded, selected, packages
-                        )
-                    ]
+            {
+                nfp.parent
+                for nfp in get_namefile_paths(
+                    p, prefix, namefile, excluded, selected, packages
                 )
-            ),
+            },
             key=keyfunc,
         ):
-            if mp not in model_paths:
+            if mp not in seen:
+                seen.add(mp)
                 model_paths.append(mp)
     return model_paths
 
@@ -436,13 +436,12 @@ def has_pkg(
         except metadata.PackageNotFoundError:
             return False
 
-    is_cached = pkg in _has_pkg_cache
-    has_metadata = try_metadata()
-    can_import = try_import()
+    # only import the package if strict, and only
+    # if it was found, since importing can be slow
     if strict:
-        found = has_metadata and can_import
+        found = try_metadata() and try_import()
     else:
-        found = has_metadata or is_cached
+        found = _has_pkg_cache.get(pkg, False) or try_metadata()
     _has_pkg_cache[pkg] = found
     return found
 
@@ -42,6 +42,17 @@ def get_ostag(kind: str = "modflow") -> str:
         raise ValueError(f"Invalid kind: {kind}")
 
 
+def _suffixes(tag: str) -> Tuple[str, str]:
+    if tag in ("win32", "win64"):
+        return ".exe", ".dll"
+    elif tag == "linux":
+        return "", ".so"
+    elif tag == "darwin" or "mac" in tag:
+        return "", ".dylib"
+    else:
+        raise KeyError(f"Invalid OS tag: {tag!r}")
+
+
 def get_binary_suffixes(ostag: str = None) -> Tuple[str, str]:
     """
     Returns executable and library suffixes for the given OS tag, if provided,
@@ -61,16 +72,6 @@ def get_binary_suffixes(ostag: str = None) -> Tuple[str, str]:
     if ostag is None:
         ostag = get_modflow_ostag()
 
-    def _suffixes(tag):
-        if tag in ["win32", "win64"]:
-            return ".exe", ".dll"
-        elif tag == "linux":
-            return "", ".so"
-        elif tag == "darwin" or "mac" in tag:
-            return "", ".dylib"
-        else:
-            raise KeyError(f"Invalid OS tag: {tag!r}")
-
     try:
         return _suffixes(ostag.lower())
     except KeyError:
@@ -159,18 +160,18 @@ def github_to_python_ostag(tag: str) -> str:
     return modflow_to_python_ostag(github_to_modflow_ostag(tag))
 
 
+_ostag_conversions = {
+    "py2mf": python_to_modflow_ostag,
+    "mf2py": modflow_to_python_ostag,
+    "gh2mf": github_to_modflow_ostag,
+    "mf2gh": modflow_to_github_ostag,
+    "py2gh": python_to_github_ostag,
+    "gh2py": github_to_python_ostag,
+}
+
+
 def convert_ostag(tag: str, mapping: str) -> str:
-    if mapping == "py2mf":
-        return python_to_modflow_ostag(tag)
-    elif mapping == "mf2py":
-        return modflow_to_python_ostag(tag)
-    elif mapping == "gh2mf":
-        return github_to_modflow_ostag(tag)
-    elif mapping == "mf2gh":
-        return modflow_to_github_ostag(tag)
-    elif mapping == "py2gh":
-        return python_to_github_ostag(tag)
-    elif mapping == "gh2py":
-        return github_to_python_ostag(tag)
-    else:
+    convert = _ostag_conversions.get(mapping)
+    if convert is None:
         raise ValueError(f"Invalid mapping: {mapping}")
+    return convert(tag)
@@ -121,12 +121,14 @@ class MFZipFile(ZipFile):
                 patterns = [patterns]
 
         # walk through dirs and add files to the list
+        seen = set(file_pths)
         for dir_pth in dir_pths:
             for dirname, subdirs, files in os.walk(dir_pth):
                 for filename in files:
                     fpth = os.path.join(dirname, filename)
                     # add the file if it does not exist in file_pths
-                    if fpth not in file_pths:
+                    if fpth not in seen:
+                        seen.add(fpth)
                         file_pths.append(fpth)
 
         # remove file_paths that do not match the patterns